@@ -124,4 +124,12 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
-DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
\ No newline at end of file
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Game state lives in the session and is read on every request; serve reads
+# from the cache and only write through to the database on save
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+# The covering indexes on Company use INCLUDE columns, which only PostgreSQL
+# supports; SQLite builds them without the included columns
+SILENCED_SYSTEM_CHECKS = ['models.W040']
@@ -6,13 +6,25 @@ Usage: python manage.py import_companies [--limit N]
 import requests
 import zipfile
 import io
+import itertools
+import os
+import re
 import csv
 import json
+import queue
+import shutil
+import tempfile
+import threading
 from decimal import Decimal, InvalidOperation
 from collections import defaultdict
-from django.core.management.base import BaseCommand
-from django.db import transaction
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
 from a_main.models import Company
+from utils.archives import read_csv_columns, read_json_array
+
 
 
 BASE_URL = "https://avaandmed.ariregister.rik.ee"
@@ -25,6 +37,73 @@ DATASETS = {
     "reports_elements_2024": f"{BASE_URL}/sites/default/files/4.2024_aruannete_elemendid_kuni_31122025_0.zip",
 }
 
+# Basic data columns in the order fetch_basic_data unpacks them
+BASIC_COLUMNS = (
+    "ariregistri_kood",
+    "nimi",
+    "ettevotja_oiguslik_vorm",
+    "ettevotja_staatus",
+    "ettevotja_staatus_tekstina",
+    "ettevotja_esmakande_kpv",
+    "ads_normaliseeritud_taisaadress",
+    "asukoha_ehak_tekstina",
+    "indeks_ettevotja_aadressis",
+    "kmkr_nr",
+    "teabesysteemi_link",
+)
+
+# Company fields filled from BASIC_COLUMNS[1:], in the same order
+BASIC_FIELDS = (
+    "name",
+    "legal_form",
+    "status",
+    "status_text",
+    "registered_date",
+    "address",
+    "county",
+    "postal_code",
+    "vat_number",
+    "registry_link",
+)
+
+# Repeated across most rows with only a few distinct values
+INTERNED_FIELDS = {"legal_form", "status", "status_text", "county"}
+
+# Annual report element labels mapped to Company fields
+FINANCIAL_LABELS = {
+    "Müügitulu": "revenue",
+    "Aruandeaasta kasum (kahjum)": "profit",
+    "Tööjõukulud": "labor_taxes",
+}
+# Matched as a substring, excluding consolidated figures
+EMPLOYEES_LABEL = "Töötajate keskmine arv"
+
+# CEO-like role codes, highest priority first
+CEO_ROLES = ("JUHL", "JUHATUSE LIIGE", "JUHATUSE ESIMEES")
+CEO_ROLE_PRIORITY = {role: i for i, role in enumerate(CEO_ROLES)}
+CEO_ROLE_RE = re.compile("|".join(map(re.escape, sorted(CEO_ROLES, key=len, reverse=True))))
+
+# Fields refreshed when a company is already in the database
+UPDATE_FIELDS = [
+    'name', 'legal_form', 'status', 'status_text', 'registered_date',
+    'registered_year', 'address', 'county', 'county_normalized',
+    'postal_code', 'activity_code', 'activity', 'vat_number', 'ceo',
+    'board_members', 'employees', 'revenue', 'profit', 'labor_taxes',
+    'registry_link'
+]
+# Fields written by the Postgres COPY import path: every concrete column but the
+# primary key, so NOT NULL columns outside UPDATE_FIELDS (report_year) still get
+# the model's default instead of NULL
+COPY_FIELDS = [f for f in Company._meta.concrete_fields if not f.primary_key]
+STAGING_TABLE = "company_stage"
+
+# Batches of Company objects buffered between building and saving
+SAVE_QUEUE_BATCHES = 20
+
+# Shared across download threads so connections to the same host are reused
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=len(DATASETS), pool_maxsize=len(DATASETS)))
+
 
 class Command(BaseCommand):
     help = 'Import Estonian business data from ariregister.rik.ee open data'
@@ -41,44 +120,78 @@ class Command(BaseCommand):
             action='store_true',
             help='Only import companies with all required fields',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Rows per INSERT statement when saving (default: $IMPORT_BULK_BATCH_SIZE or 500)',
+        )
 
     def handle(self, *args, **options):
         limit = options['limit']
         filter_complete = options['filter_complete']
+        batch_size = options['batch_size']
+        if batch_size is None:
+            # Read here rather than in add_arguments, so a bad value can't break --help
+            batch_size = os.environ.get('IMPORT_BULK_BATCH_SIZE', '500')
+            try:
+                batch_size = int(batch_size)
+            except ValueError:
+                raise CommandError(f"--batch-size must be a positive integer, got {batch_size}") from None
+        if batch_size < 1:
+            raise CommandError(f"--batch-size must be a positive integer, got {batch_size}")
         
         self.stdout.write("=" * 60)
         self.stdout.write("Estonian Business Registry Data Import")
         self.stdout.write("=" * 60)
         
-        # Step 1: Fetch basic data
-        self.stdout.write("\nStep 1: Fetching basic company data...")
-        companies = self.fetch_basic_data(limit)
-        self.stdout.write(f"  → Found {len(companies)} companies")
-        
-        # Step 2: Fetch general data (for EMTAK activity codes)
-        self.stdout.write("\nStep 2: Fetching activity codes (EMTAK)...")
-        activities = self.fetch_activity_data(limit)
-        self.stdout.write(f"  → Found activities for {len(activities)} companies")
-        
-        # Step 3: Fetch persons data
-        self.stdout.write("\nStep 3: Fetching persons/management data...")
-        persons = self.fetch_persons_data(limit)
-        self.stdout.write(f"  → Found persons for {len(persons)} companies")
-        
-        # Step 4: Fetch financial data
-        self.stdout.write("\nStep 4: Fetching report mapping...")
-        report_to_company = self.fetch_reports_mapping()
-        self.stdout.write(f"  → Mapped {len(report_to_company)} reports")
-        
-        self.stdout.write("\nStep 5: Fetching financial data...")
-        financials = self.fetch_financial_data(report_to_company, limit)
-        self.stdout.write(f"  → Found financials for {len(financials)} companies")
-        
-        # Step 6: Merge and save
-        self.stdout.write("\nStep 6: Merging and saving to database...")
-        saved, skipped = self.save_companies(
-            companies, activities, persons, financials, filter_complete
-        )
+        downloads = {}
+        try:
+            # Download all datasets in parallel (network-bound)
+            self.stdout.write("\nDownloading datasets...")
+            with ThreadPoolExecutor(max_workers=len(DATASETS)) as ex:
+                futures = {name: ex.submit(self.download_zip, url) for name, url in DATASETS.items()}
+            # Record every finished download before re-raising a failure, so the
+            # cleanup below also removes the archives that did arrive
+            downloads = {name: future.result() for name, future in futures.items() if future.exception() is None}
+            for future in futures.values():
+                future.result()
+            
+            # Step 1: Fetch basic data
+            self.stdout.write("\nStep 1: Fetching basic company data...")
+            companies, columns = self.fetch_basic_data(downloads["basic_csv"], limit)
+            self.stdout.write(f"  → Found {len(companies)} companies")
+            
+            # Step 2: Fetch general data (for EMTAK activity codes)
+            self.stdout.write("\nStep 2: Fetching activity codes (EMTAK)...")
+            activities = self.fetch_activity_data(downloads["general_json"], limit)
+            self.stdout.write(f"  → Found activities for {len(activities)} companies")
+            
+            # Step 3: Fetch persons data
+            self.stdout.write("\nStep 3: Fetching persons/management data...")
+            persons = self.fetch_persons_data(downloads["persons_json"], limit)
+            self.stdout.write(f"  → Found persons for {len(persons)} companies")
+            
+            # Step 4: Fetch financial data
+            self.stdout.write("\nStep 4: Fetching financial data...")
+            financials = self.fetch_financial_data(
+                downloads["reports_elements_2024"], downloads["reports_general"], limit
+            )
+            self.stdout.write(f"  → Found financials for {len(financials)} companies")
+            
+            # Step 5: Merge and save
+            self.stdout.write("\nStep 5: Merging and saving to database...")
+            indexes = self.drop_secondary_indexes()
+            try:
+                saved, skipped = self.save_companies(
+                    companies, columns, activities, persons, financials, filter_complete, batch_size
+                )
+            finally:
+                self.recreate_indexes(indexes)
+        finally:
+            # Downloads are temp files on disk, clean them up
+            for path in downloads.values():
+                os.remove(path)
         
         self.stdout.write(self.style.SUCCESS(f"\n✓ Saved {saved} companies to database"))
         if skipped:
@@ -90,73 +203,74 @@ class Command(BaseCommand):
         self.stdout.write(f"\nDatabase now contains {total} companies ({complete} with complete data)")
 
     def download_zip(self, url):
-        """Download a zip file."""
+        """Download a zip file to a temporary file and return its path."""
         filename = url.split('/')[-1]
         self.stdout.write(f"    Downloading: {filename}")
-        response = requests.get(url, timeout=600)
-        response.raise_for_status()
-        return response.content
+        with SESSION.get(url, stream=True, timeout=600) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as tmp:
+                try:
+                    shutil.copyfileobj(response.raw, tmp, length=1 << 20)
+                except BaseException:
+                    # Don't leave a partial archive behind
+                    tmp.close()
+                    os.unlink(tmp.name)
+                    raise
+        return tmp.name
 
-    def extract_csv(self, zip_content, delimiter=';'):
-        """Extract and parse CSV from zip."""
-        with zipfile.ZipFile(io.BytesIO(zip_content)) as zf:
+    def extract_csv(self, zip_path, columns, delimiter=';'):
+        """Stream CSV rows from zip as tuples of the requested columns."""
+        with zipfile.ZipFile(zip_path) as zf:
             csv_files = [f for f in zf.namelist() if f.endswith('.csv')]
             if not csv_files:
-                return []
-            with zf.open(csv_files[0]) as f:
-                content = f.read().decode('utf-8-sig')
-                return list(csv.DictReader(io.StringIO(content), delimiter=delimiter))
-
-    def extract_json(self, zip_content):
-        """Extract and parse JSON from zip."""
-        with zipfile.ZipFile(io.BytesIO(zip_content)) as zf:
+                return
+            with zf.open(csv_files[0]) as raw, io.TextIOWrapper(raw, encoding='utf-8-sig', newline='') as f:
+                yield from read_csv_columns(f, columns, csv_files[0], delimiter)
+
+    def extract_json(self, zip_path, chunk_size=1 << 20):
+        """Stream items of the top-level JSON array in zip, one at a time."""
+        with zipfile.ZipFile(zip_path) as zf:
             json_files = [f for f in zf.namelist() if f.endswith('.json')]
             if not json_files:
-                return []
-            with zf.open(json_files[0]) as f:
-                content = f.read().decode('utf-8-sig')
-                return json.loads(content)
-
-    def fetch_basic_data(self, limit=None):
-        """Fetch basic company data."""
-        zip_content = self.download_zip(DATASETS["basic_csv"])
-        data = self.extract_csv(zip_content)
+                return
+            with zf.open(json_files[0]) as raw, io.TextIOWrapper(raw, encoding='utf-8-sig') as f:
+                yield from read_json_array(f, json_files[0], chunk_size)
+
+    def fetch_basic_data(self, zip_path, limit=None):
+        """Fetch basic company data as (reg_code -> row index, field -> column list)."""
+        rows = self.extract_csv(zip_path, BASIC_COLUMNS)
         
+        # Stored column-wise: one list per field plus reg_code -> row position,
+        # instead of a dict per company
         companies = {}
-        for i, row in enumerate(data):
+        columns = {field: [] for field in BASIC_FIELDS}
+        appends = [columns[field].append for field in BASIC_FIELDS]
+        # Low-cardinality fields share one str object per distinct value
+        pools = [{} if field in INTERNED_FIELDS else None for field in BASIC_FIELDS]
+        for i, row in enumerate(rows):
             if limit and i >= limit:
                 break
             
-            reg_code = row.get("ariregistri_kood", "").strip()
+            reg_code = row[0].strip()
             if not reg_code:
                 continue
             
-            companies[reg_code] = {
-                "name": row.get("nimi", "").strip(),
-                "registry_code": reg_code,
-                "legal_form": row.get("ettevotja_oiguslik_vorm", "").strip(),
-                "status": row.get("ettevotja_staatus", "").strip(),
-                "status_text": row.get("ettevotja_staatus_tekstina", "").strip(),
-                "registered_date": row.get("ettevotja_esmakande_kpv", "").strip(),
-                "address": row.get("ads_normaliseeritud_taisaadress", "").strip(),
-                "county": row.get("asukoha_ehak_tekstina", "").strip(),
-                "postal_code": row.get("indeks_ettevotja_aadressis", "").strip(),
-                "vat_number": row.get("kmkr_nr", "").strip(),
-                "registry_link": row.get("teabesysteemi_link", "").strip(),
-            }
+            companies[reg_code] = len(columns["name"])
+            for append, pool, value in zip(appends, pools, row[1:]):
+                value = value.strip()
+                if pool is not None:
+                    value = pool.setdefault(value, value)
+                append(value)
         
-        return companies
+        return companies, columns
 
-    def fetch_activity_data(self, limit=None):
+    def fetch_activity_data(self, zip_path, limit=None):
         """Fetch EMTAK activity codes from general data."""
-        zip_content = self.download_zip(DATASETS["general_json"])
-        data = self.extract_json(zip_content)
+        records = itertools.islice(self.extract_json(zip_path), limit or None)
         
         activities = {}
-        for i, record in enumerate(data):
-            if limit and i >= limit:
-                break
-            
+        for record in records:
             reg_code = str(record.get("ariregistri_kood", "")).strip()
             if not reg_code:
                 continue
@@ -180,187 +294,298 @@ class Command(BaseCommand):
         
         return activities
 
-    def fetch_persons_data(self, limit=None):
-        """Fetch persons associated with companies."""
-        zip_content = self.download_zip(DATASETS["persons_json"])
-        data = self.extract_json(zip_content)
+    def fetch_persons_data(self, zip_path, limit=None):
+        """Fetch CEO and board member names per company."""
+        records = itertools.islice(self.extract_json(zip_path), limit or None)
         
         persons_by_company = {}
-        for i, record in enumerate(data):
-            if limit and i >= limit:
-                break
-            
+        for record in records:
             reg_code = str(record.get("ariregistri_kood", "")).strip()
             if not reg_code:
                 continue
             
             persons_list = record.get("kaardile_kantud_isikud", [])
-            persons = []
+            names = []
+            # Keep the first person holding the highest-priority CEO role
+            ceo, ceo_priority = None, len(CEO_ROLES)
             
             for p in persons_list:
                 first_name = p.get("eesnimi", "") or ""
                 last_name = p.get("nimi_arinimi", "") or ""
                 full_name = f"{first_name} {last_name}".strip()
                 
-                if full_name:
-                    persons.append({
-                        "name": full_name,
-                        "role": p.get("isiku_roll", ""),
-                        "role_text": p.get("isiku_roll_tekstina", ""),
-                    })
+                if not full_name:
+                    continue
+                names.append(full_name)
+                
+                if ceo_priority:
+                    role = f"{p.get('isiku_roll', '')} {p.get('isiku_roll_tekstina', '')}".upper()
+                    for role_code in CEO_ROLE_RE.findall(role):
+                        priority = CEO_ROLE_PRIORITY[role_code]
+                        if priority < ceo_priority:
+                            ceo, ceo_priority = full_name, priority
             
-            if persons:
-                persons_by_company[reg_code] = persons
+            if names:
+                persons_by_company[reg_code] = {
+                    "ceo": ceo or names[0],
+                    "board": names,
+                }
         
         return persons_by_company
 
-    def fetch_reports_mapping(self):
-        """Fetch mapping from report_id to registrikood."""
-        zip_content = self.download_zip(DATASETS["reports_general"])
-        data = self.extract_csv(zip_content)
-        
-        report_to_company = {}
-        for row in data:
-            report_id = row.get("report_id", "").strip()
-            reg_code = row.get("registrikood", "").strip()
-            if report_id and reg_code:
-                report_to_company[report_id] = reg_code
-        
-        return report_to_company
-
-    def fetch_financial_data(self, report_to_company, limit=None):
-        """Fetch financial data from annual reports."""
-        zip_content = self.download_zip(DATASETS["reports_elements_2024"])
-        data = self.extract_csv(zip_content)
+    def fetch_financial_data(self, elements_path, reports_path, limit=None):
+        """Fetch financial data from annual reports, keyed by registry code."""
+        # Build side: only the element rows we use, keyed by report_id
+        rows = self.extract_csv(elements_path, ("report_id", "elemendi_label", "vaartus"))
         
-        financials = defaultdict(dict)
+        by_report = defaultdict(dict)
         
-        for i, row in enumerate(data):
+        for i, (report_id, label, value) in enumerate(rows):
             if limit and i >= limit * 10:  # More elements per company
                 break
             
-            report_id = row.get("report_id", "").strip()
-            reg_code = report_to_company.get(report_id)
-            if not reg_code:
-                continue
+            # Most element rows are labels we don't use, so reject them first
+            field = FINANCIAL_LABELS.get(label)
+            if field is None:
+                if EMPLOYEES_LABEL not in label or "Konsolideeritud" in label:
+                    continue
+                field = "employees"
             
-            label = row.get("elemendi_label", "")
-            value = row.get("vaartus", "").strip()
+            value = value.strip()
             
-            if "Töötajate keskmine arv" in label and "Konsolideeritud" not in label:
+            # Parse here, once per kept element, so save_companies gets ready values
+            if field == "employees":
                 try:
-                    financials[reg_code]["employees"] = float(value)
+                    by_report[report_id.strip()]["employees"] = float(value)
                 except (ValueError, TypeError):
                     pass
-            elif label == "Müügitulu":
-                financials[reg_code]["revenue"] = value
-            elif label == "Aruandeaasta kasum (kahjum)":
-                financials[reg_code]["profit"] = value
-            elif label == "Tööjõukulud":
-                financials[reg_code]["labor_taxes"] = value
+            else:
+                amount = self.to_decimal(value)
+                if amount is not None:
+                    by_report[report_id.strip()][field] = amount
         
-        return dict(financials)
-
-    def identify_ceo(self, persons):
-        """Identify CEO from persons list."""
-        ceo_roles = ["JUHL", "JUHATUSE LIIGE", "JUHATUSE ESIMEES"]
-        
-        for role_code in ceo_roles:
-            for person in persons:
-                role = f"{person.get('role', '')} {person.get('role_text', '')}".upper()
-                if role_code in role and person.get("name"):
-                    return person.get("name")
+        # Probe side: stream the report list and attach each matching report
+        # to its company, so no full report_id -> registrikood map is built
+        financials = defaultdict(dict)
+        for report_id, reg_code in self.extract_csv(reports_path, ("report_id", "registrikood")):
+            fin = by_report.get(report_id.strip())
+            reg_code = reg_code.strip()
+            if fin and reg_code:
+                financials[reg_code].update(fin)
         
-        if persons:
-            return persons[0].get("name", "")
-        return ""
+        return dict(financials)
 
     def to_decimal(self, value):
-        """Convert value to Decimal or None."""
+        """Convert a report value string to Decimal or None."""
         if not value:
             return None
+        if "," in value:
+            value = value.replace(",", ".")
         try:
-            return Decimal(str(value).replace(",", "."))
+            return Decimal(value)
         except (InvalidOperation, ValueError):
             return None
 
-    @transaction.atomic
-    def save_companies(self, companies, activities, persons, financials, filter_complete):
-        """Save all companies to database."""
-        saved = 0
+    def save_companies(self, companies, columns, activities, persons, financials, filter_complete, batch_size=500):
+        """Save all companies to database.
+        
+        Company objects are built here and handed in batches through a bounded
+        queue to a writer thread, so building and database round-trips overlap.
+        """
         skipped = 0
         batch = []
-        batch_size = 1000
+        batches = queue.Queue(maxsize=SAVE_QUEUE_BATCHES)
+        aborted = threading.Event()
         
-        for reg_code, company in companies.items():
-            # Merge data
-            activity = activities.get(reg_code, {})
-            company_persons = persons.get(reg_code, [])
-            fin = financials.get(reg_code, {})
-            
-            # Build company object
-            obj = Company(
-                name=company.get("name", ""),
-                registry_code=reg_code,
-                legal_form=company.get("legal_form", ""),
-                status=company.get("status", ""),
-                status_text=company.get("status_text", ""),
-                registered_date=company.get("registered_date", ""),
-                address=company.get("address", ""),
-                county=company.get("county", ""),
-                postal_code=company.get("postal_code", ""),
-                activity_code=activity.get("activity_code", ""),
-                activity=activity.get("activity", ""),
-                vat_number=company.get("vat_number", ""),
-                ceo=self.identify_ceo(company_persons),
-                board_members=", ".join(p.get("name", "") for p in company_persons),
-                employees=fin.get("employees"),
-                revenue=self.to_decimal(fin.get("revenue")),
-                profit=self.to_decimal(fin.get("profit")),
-                labor_taxes=self.to_decimal(fin.get("labor_taxes")),
-                registry_link=company.get("registry_link", ""),
-            )
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            writer = ex.submit(self.write_companies, batches, aborted, batch_size)
             
-            # Filter if requested
-            if filter_complete:
-                if not all([
-                    obj.name, obj.registry_code, obj.county, obj.activity,
-                    obj.employees is not None, obj.revenue is not None
-                ]):
-                    skipped += 1
-                    continue
+            def put(item):
+                # Surface writer errors instead of blocking forever on a full queue
+                while True:
+                    if writer.done():
+                        writer.result()
+                    try:
+                        batches.put(item, timeout=1)
+                        return
+                    except queue.Full:
+                        pass
             
-            batch.append(obj)
+            try:
+                for reg_code, i in companies.items():
+                    # Merge data
+                    activity = activities.get(reg_code, {})
+                    company_persons = persons.get(reg_code, {})
+                    fin = financials.get(reg_code, {})
+                    
+                    # Filter if requested, before paying for the model instance
+                    if filter_complete and not (
+                        columns["name"][i] and columns["county"][i] and activity.get("activity")
+                        and fin.get("employees") is not None and fin.get("revenue") is not None
+                    ):
+                        skipped += 1
+                        continue
+                    
+                    # Build company object
+                    obj = Company(
+                        name=columns["name"][i],
+                        registry_code=reg_code,
+                        legal_form=columns["legal_form"][i],
+                        status=columns["status"][i],
+                        status_text=columns["status_text"][i],
+                        registered_date=columns["registered_date"][i],
+                        address=columns["address"][i],
+                        county=columns["county"][i],
+                        postal_code=columns["postal_code"][i],
+                        activity_code=activity.get("activity_code", ""),
+                        activity=activity.get("activity", ""),
+                        vat_number=columns["vat_number"][i],
+                        ceo=company_persons.get("ceo", ""),
+                        board_members=company_persons.get("board", []),
+                        employees=fin.get("employees"),
+                        revenue=fin.get("revenue"),
+                        profit=fin.get("profit"),
+                        labor_taxes=fin.get("labor_taxes"),
+                        registry_link=columns["registry_link"][i],
+                    )
+                    # bulk_create and COPY skip pre_save, so derive these here
+                    obj.fill_derived_fields()
+                    
+                    batch.append(obj)
+                    if len(batch) >= batch_size:
+                        put(batch)
+                        batch = []
+                
+                if batch:
+                    put(batch)
+            except BaseException:
+                aborted.set()
+                raise
+            finally:
+                put(None)
             
-            if len(batch) >= batch_size:
-                Company.objects.bulk_create(
-                    batch,
-                    update_conflicts=True,
-                    unique_fields=['registry_code'],
-                    update_fields=[
-                        'name', 'legal_form', 'status', 'status_text', 'registered_date',
-                        'address', 'county', 'postal_code', 'activity_code', 'activity',
-                        'vat_number', 'ceo', 'board_members', 'employees', 'revenue',
-                        'profit', 'labor_taxes', 'registry_link'
-                    ]
-                )
-                saved += len(batch)
-                self.stdout.write(f"    Saved {saved} companies...")
-                batch = []
+            saved = writer.result()
+        
+        return saved, skipped
+
+    def write_companies(self, batches, aborted, batch_size):
+        """Drain company batches from the queue and save them in one transaction."""
+        saved = 0
+        try:
+            with transaction.atomic():
+                use_copy = connection.vendor == 'postgresql'
+                if use_copy:
+                    # One-shot bulk load: don't wait on WAL flushes and give the upsert
+                    # more sort/hash memory. LOCAL scopes both to this transaction.
+                    with connection.cursor() as cursor:
+                        cursor.execute("SET LOCAL synchronous_commit = OFF")
+                        cursor.execute("SET LOCAL work_mem = '256MB'")
+                    # COPY rows into a staging table and upsert them in one statement
+                    # instead of running a multi-VALUES INSERT per batch
+                    self.create_staging_table()
+                
+                while (batch := batches.get()) is not None:
+                    if use_copy:
+                        self.copy_to_staging_table(batch)
+                    else:
+                        # Django splits this into batch_size chunks within the backend's parameter limits
+                        Company.objects.bulk_create(
+                            batch,
+                            batch_size=batch_size,
+                            update_conflicts=True,
+                            unique_fields=['registry_code'],
+                            update_fields=UPDATE_FIELDS,
+                        )
+                    saved += len(batch)
+                
+                # Roll back rather than commit a partial import
+                if aborted.is_set():
+                    raise CommandError("Import aborted, no companies were saved")
+                
+                if use_copy:
+                    self.merge_staging_table()
+        finally:
+            # This thread has its own database connection
+            connection.close()
+        return saved
+
+    def drop_secondary_indexes(self):
+        """Drop non-unique Company indexes before a bulk load (Postgres only).
         
-        # Save remaining
-        if batch:
-            Company.objects.bulk_create(
-                batch,
-                update_conflicts=True,
-                unique_fields=['registry_code'],
-                update_fields=[
-                    'name', 'legal_form', 'status', 'status_text', 'registered_date',
-                    'address', 'county', 'postal_code', 'activity_code', 'activity',
-                    'vat_number', 'ceo', 'board_members', 'employees', 'revenue',
-                    'profit', 'labor_taxes', 'registry_link'
-                ]
+        Returns their definitions for recreate_indexes(). Unique indexes stay,
+        the upsert needs registry_code's.
+        """
+        if connection.vendor != 'postgresql':
+            return []
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname, indexdef FROM pg_indexes "
+                "WHERE schemaname = current_schema() AND tablename = %s",
+                [Company._meta.db_table],
+            )
+            indexes = [(name, sql) for name, sql in cursor.fetchall() if sql.startswith("CREATE INDEX ")]
+            for name, _ in indexes:
+                cursor.execute(f"DROP INDEX IF EXISTS {connection.ops.quote_name(name)}")
+        if indexes:
+            self.stdout.write(f"    Dropped {len(indexes)} indexes for the load")
+        return indexes
+
+    def recreate_indexes(self, indexes):
+        """Rebuild indexes dropped by drop_secondary_indexes()."""
+        if not indexes:
+            return
+        # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+        with connection.cursor() as cursor:
+            for _, sql in indexes:
+                cursor.execute(sql.replace("CREATE INDEX ", "CREATE INDEX CONCURRENTLY IF NOT EXISTS ", 1))
+        self.stdout.write(f"    Recreated {len(indexes)} indexes")
+
+    def create_staging_table(self):
+        """Create an empty temp table shaped like the COPY columns (Postgres only)."""
+        table = connection.ops.quote_name(Company._meta.db_table)
+        columns = ", ".join(connection.ops.quote_name(f.column) for f in COPY_FIELDS)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMP TABLE {STAGING_TABLE} ON COMMIT DROP AS "
+                f"SELECT {columns} FROM {table} WITH NO DATA"
             )
-            saved += len(batch)
+
+    def copy_to_staging_table(self, objs):
+        """Stream companies into the staging table with a single COPY."""
+        now = timezone.now()
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for obj in objs:
+            obj.created_at = obj.updated_at = now
+            row = []
+            for field in COPY_FIELDS:
+                value = getattr(obj, field.attname)
+                if value is None:
+                    value = r'\N'
+                elif isinstance(value, (list, dict)):  # JSONField
+                    value = json.dumps(value)
+                row.append(value)
+            writer.writerow(row)
+        buf.seek(0)
         
-        return saved, skipped
+        columns = ", ".join(connection.ops.quote_name(f.column) for f in COPY_FIELDS)
+        sql = f"COPY {STAGING_TABLE} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        with connection.cursor() as cursor:
+            if hasattr(cursor.cursor, 'copy_expert'):  # psycopg2
+                cursor.copy_expert(sql, buf)
+            else:  # psycopg 3
+                with cursor.copy(sql) as copy:
+                    copy.write(buf.getvalue())
+
+    def merge_staging_table(self):
+        """Upsert everything in the staging table in a single statement."""
+        qn = connection.ops.quote_name
+        table = qn(Company._meta.db_table)
+        columns = ", ".join(qn(f.column) for f in COPY_FIELDS)
+        # Only UPDATE_FIELDS are refreshed on existing rows, as on the bulk_create path
+        updates = ", ".join(f"{qn(c)} = EXCLUDED.{qn(c)}" for c in UPDATE_FIELDS + ['updated_at'])
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {STAGING_TABLE} "
+                f"ON CONFLICT ({qn('registry_code')}) DO UPDATE SET {updates}"
+            )
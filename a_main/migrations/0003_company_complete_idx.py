@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-14 04:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('a_main', '0002_company_activity_company_activity_code_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='company',
+            index=models.Index(condition=models.Q(('revenue__isnull', False), ('employees__isnull', False)), fields=['county', 'activity'], name='complete_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-14 04:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('a_main', '0003_company_complete_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='company',
+            index=models.Index(fields=['county', '-revenue'], include=('name', 'activity', 'employees'), name='county_rev_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='company',
+            index=models.Index(fields=['activity_code', '-revenue'], include=('name', 'county'), name='act_rev_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 6.0.1 on 2026-10-14 04:58
+
+import json
+
+from django.db import migrations, models
+
+
+def board_members_to_json(apps, schema_editor):
+    """Rewrite comma-joined board member names as JSON lists."""
+    Company = apps.get_model('a_main', 'Company')
+    batch = []
+    for company in Company.objects.only('id', 'board_members').iterator(chunk_size=2000):
+        names = [m.strip() for m in company.board_members.split(',')] if company.board_members else []
+        company.board_members = json.dumps(names, ensure_ascii=False)
+        batch.append(company)
+        if len(batch) >= 2000:
+            Company.objects.bulk_update(batch, ['board_members'])
+            batch = []
+    if batch:
+        Company.objects.bulk_update(batch, ['board_members'])
+
+
+def board_members_to_text(apps, schema_editor):
+    """Rewrite JSON lists of board member names as comma-joined text."""
+    Company = apps.get_model('a_main', 'Company')
+    batch = []
+    for company in Company.objects.only('id', 'board_members').iterator(chunk_size=2000):
+        company.board_members = ", ".join(json.loads(company.board_members or '[]'))
+        batch.append(company)
+        if len(batch) >= 2000:
+            Company.objects.bulk_update(batch, ['board_members'])
+            batch = []
+    if batch:
+        Company.objects.bulk_update(batch, ['board_members'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('a_main', '0004_company_covering_revenue_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(board_members_to_json, board_members_to_text),
+        migrations.AlterField(
+            model_name='company',
+            name='board_members',
+            field=models.JSONField(blank=True, default=list, verbose_name='Juhatuse liikmed'),
+        ),
+    ]
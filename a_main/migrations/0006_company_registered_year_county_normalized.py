@@ -0,0 +1,71 @@
+# Generated by Django 6.0.1 on 2026-10-14 05:06
+
+from datetime import datetime
+
+from django.db import migrations, models
+
+
+# Frozen copies of the a_main.models helpers as of this migration, so later
+# edits to the model code can't change what the backfill does
+
+def get_year_from_date(date_str):
+    """Extract the year from a DD.MM.YYYY date string."""
+    if not date_str:
+        return None
+    parts = date_str.split('.')
+    if len(parts) != 3:
+        return None
+    day, month, year = parts
+    if not (
+        0 < len(day) <= 2 and 0 < len(month) <= 2 and len(year) == 4
+        and date_str.isascii() and day.isdigit() and month.isdigit() and year.isdigit()
+    ):
+        return None
+    try:
+        return datetime(int(year), int(month), int(day)).year
+    except ValueError:
+        return None
+
+
+def extract_county_name(county_str):
+    """Normalize a county field, e.g. 'harju' from '..., Harju maakond'."""
+    if not county_str:
+        return None
+    county = county_str.split(',')[-1].strip().replace(' maakond', '').strip().lower()
+    return county or None
+
+
+def fill_derived_fields(apps, schema_editor):
+    """Backfill registered_year and county_normalized for existing rows."""
+    Company = apps.get_model('a_main', 'Company')
+    batch = []
+    for company in Company.objects.only('id', 'registered_date', 'county').iterator(chunk_size=2000):
+        company.registered_year = get_year_from_date(company.registered_date)
+        company.county_normalized = extract_county_name(company.county) or ""
+        batch.append(company)
+        if len(batch) >= 2000:
+            Company.objects.bulk_update(batch, ['registered_year', 'county_normalized'])
+            batch = []
+    if batch:
+        Company.objects.bulk_update(batch, ['registered_year', 'county_normalized'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('a_main', '0005_company_board_members_json'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='county_normalized',
+            field=models.CharField(blank=True, db_index=True, max_length=100, verbose_name='Maakond'),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='registered_year',
+            field=models.IntegerField(blank=True, db_index=True, null=True, verbose_name='Registreerimisaasta'),
+        ),
+        migrations.RunPython(fill_derived_fields, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,58 @@
+from datetime import datetime
+from functools import cached_property
+
 from django.db import models
+from django.db.models import Q
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+
+def parse_date(date_str):
+    """Parse Estonian date format DD.MM.YYYY to datetime."""
+    if not date_str:
+        return None
+    # Fixed format, so split it by hand instead of going through strptime.
+    # Only accept what '%d.%m.%Y' would: plain ASCII digits, 1-2 for the day
+    # and month and exactly 4 for the year (int() alone allows ' 1', '+1', '1_0')
+    parts = date_str.split('.')
+    if len(parts) != 3:
+        return None
+    day, month, year = parts
+    if not (
+        0 < len(day) <= 2 and 0 < len(month) <= 2 and len(year) == 4
+        and date_str.isascii() and day.isdigit() and month.isdigit() and year.isdigit()
+    ):
+        return None
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def get_year_from_date(date_str):
+    """Extract year from date string."""
+    dt = parse_date(date_str)
+    return dt.year if dt else None
+
+
+def extract_county_name(county_str):
+    """Extract county name from county field.
+    
+    Format is typically: "address, city, COUNTY maakond"
+    Returns normalized county name (e.g., 'harju' from 'Harju maakond')
+    """
+    if not county_str:
+        return None
+    # Extract the last part after final comma (the county)
+    parts = [p.strip() for p in county_str.split(',')]
+    if not parts:
+        return None
+    
+    # Get the last part which should be "COUNTY maakond"
+    county_part = parts[-1]
+    # Remove "maakond" suffix and normalize
+    county = county_part.replace(' maakond', '').strip().lower()
+    return county if county else None
 
 
 class Company(models.Model):
@@ -11,10 +65,12 @@ class Company(models.Model):
     status = models.CharField(max_length=50, blank=True, verbose_name="Staatus")
     status_text = models.CharField(max_length=100, blank=True, verbose_name="Staatus tekstina")
     registered_date = models.CharField(max_length=20, blank=True, verbose_name="Registreeritud")
+    registered_year = models.IntegerField(null=True, blank=True, db_index=True, verbose_name="Registreerimisaasta")
     
     # Location
     address = models.CharField(max_length=500, blank=True, verbose_name="Aadress")
     county = models.CharField(max_length=200, blank=True, db_index=True, verbose_name="Piirkond")
+    county_normalized = models.CharField(max_length=100, blank=True, db_index=True, verbose_name="Maakond")
     postal_code = models.CharField(max_length=10, blank=True, verbose_name="Postiindeks")
     
     # Business activity (EMTAK)
@@ -28,7 +84,7 @@ class Company(models.Model):
     
     # Management
     ceo = models.CharField(max_length=200, blank=True, verbose_name="Juht")
-    board_members = models.TextField(blank=True, verbose_name="Juhatuse liikmed")
+    board_members = models.JSONField(default=list, blank=True, verbose_name="Juhatuse liikmed")
     
     # Financial data
     employees = models.FloatField(null=True, blank=True, db_index=True, verbose_name="Töötajaid")
@@ -47,38 +103,63 @@ class Company(models.Model):
         verbose_name = "Ettevõte"
         verbose_name_plural = "Ettevõtted"
         ordering = ['name']
+        indexes = [
+            # Partial index for the get_complete_companies() query path
+            models.Index(
+                fields=['county', 'activity'],
+                condition=Q(revenue__isnull=False) & Q(employees__isnull=False),
+                name='complete_idx',
+            ),
+            # Covering indexes for per-county / per-activity lists ordered by revenue
+            # (INCLUDE columns allow index-only scans on PostgreSQL)
+            models.Index(
+                fields=['county', '-revenue'],
+                include=['name', 'activity', 'employees'],
+                name='county_rev_idx',
+            ),
+            models.Index(
+                fields=['activity_code', '-revenue'],
+                include=['name', 'county'],
+                name='act_rev_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.registry_code})"
     
-    def get_board_members_list(self):
-        """Return board members as a list."""
-        if self.board_members:
-            return [m.strip() for m in self.board_members.split(',')]
-        return []
+    def fill_derived_fields(self):
+        """Set registered_year and county_normalized from the raw text fields.
+        
+        Saves run this through pre_save; bulk_create skips signals, so bulk
+        loaders call it themselves.
+        """
+        self.registered_year = get_year_from_date(self.registered_date)
+        self.county_normalized = extract_county_name(self.county) or ""
+    
+    @cached_property
+    def board_members_display(self):
+        """Board members joined for display, computed once per instance."""
+        return ", ".join(self.board_members) if self.board_members else ""
     
     @classmethod
     def get_complete_companies(cls):
         """Get companies with all required fields filled."""
-        return cls.objects.exclude(
-            name='',
-        ).exclude(
-            registry_code='',
-        ).exclude(
-            legal_form='',
-        ).exclude(
-            registered_date='',
-        ).exclude(
-            county='',
-        ).exclude(
-            activity='',
-        ).exclude(
-            ceo='',
-        ).exclude(
-            board_members='',
-        ).filter(
-            employees__isnull=False,
-            revenue__isnull=False,
-            profit__isnull=False,
-            labor_taxes__isnull=False,
+        return cls.objects.filter(
+            ~Q(name='')
+            & ~Q(registry_code='')
+            & ~Q(legal_form='')
+            & ~Q(registered_date='')
+            & ~Q(county='')
+            & ~Q(activity='')
+            & ~Q(ceo='')
+            & ~Q(board_members=[])
+            & Q(employees__isnull=False)
+            & Q(revenue__isnull=False)
+            & Q(profit__isnull=False)
+            & Q(labor_taxes__isnull=False)
         )
+
+
+@receiver(pre_save, sender=Company)
+def fill_company_derived_fields(sender, instance, **kwargs):
+    instance.fill_derived_fields()
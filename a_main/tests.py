@@ -1,3 +1,46 @@
-from django.test import TestCase
+import io
+import json
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from utils.archives import read_csv_columns, read_json_array
+
+
+class ReadJsonArrayTests(SimpleTestCase):
+    ITEMS = [{"a": [1, {"b": "]"}]}, 1.5, -3e2, 12345, "s, t", [], True, None, {"ä": "õ"}]
+
+    def read(self, text, chunk_size):
+        return list(read_json_array(io.StringIO(text), "test.json", chunk_size))
+
+    def test_items_survive_every_chunk_boundary(self):
+        text = json.dumps(self.ITEMS, ensure_ascii=False, indent=1)
+        for chunk_size in range(1, len(text) + 2):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.read(text, chunk_size), self.ITEMS)
+
+    def test_number_split_across_chunks(self):
+        self.assertEqual(self.read("[1.5, 20]", 3), [1.5, 20])
+
+    def test_empty_array(self):
+        self.assertEqual(self.read(" [ ] ", 1), [])
+
+    def test_rejects_non_array(self):
+        with self.assertRaises(ValueError):
+            self.read('{"a": 1}', 4)
+
+    def test_rejects_missing_comma(self):
+        with self.assertRaises(ValueError):
+            self.read("[1 2]", 4)
+
+
+class ReadCsvColumnsTests(SimpleTestCase):
+    def read(self, text, columns):
+        return list(read_csv_columns(io.StringIO(text), columns, "test.csv"))
+
+    def test_picks_columns_and_skips_blank_lines(self):
+        text = "a;b;c\n1;2;3\n\n4;5;6\n\n"
+        self.assertEqual(self.read(text, ("c", "a")), [("3", "1"), ("6", "4")])
+
+    def test_missing_column(self):
+        with self.assertRaises(ValueError):
+            self.read("a;b\n1;2\n", ("a", "z"))
@@ -2,10 +2,15 @@
 Majandusmäng - Estonian Business Quiz Game
 """
 import random
-from datetime import datetime
+import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from operator import itemgetter
 from decimal import Decimal
 from django.shortcuts import render, redirect
 from django.db.models import Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from .models import Company
 
 
@@ -23,8 +28,36 @@ MIN_DIFF = {
     'labor_taxes': Decimal('100000'),  # 100K euros
 }
 
+# Amount suffixes used in question text
+MILLION = "miljonit"
+THOUSAND = "tuhat"
+
+# Candidate sampling
+CANDIDATE_SAMPLE_SIZE = 500  # Companies drawn per question attempt
+ELIGIBLE_IDS_TTL = 300  # Seconds before the cached eligible ids are reloaded
+
+# Company fields shown on the answer cards, kept in the session for the feedback view
+DISPLAY_FIELDS = (
+    'name', 'registry_code', 'legal_form', 'registered_date', 'county',
+    'activity', 'ceo', 'board_members_display', 'employees', 'revenue',
+    'profit', 'labor_taxes', 'vat_number',
+)
+
+# Question types that only need two companies with different values of a column
+BUCKET_FIELDS = {
+    'county': 'county_normalized',
+    'ceo': 'ceo',
+    'activity': 'activity',
+    'legal_form': 'legal_form',
+}
+
+# Per-process cache of complete company ids, so questions don't sort the table.
+# 'buckets' maps each BUCKET_FIELDS column to (values, {value: [ids]}).
+# 'no_vat_ids' are otherwise complete companies without a VAT number.
+_ELIGIBLE_IDS_CACHE = {'ts': 0, 'ids': [], 'no_vat_ids': [], 'buckets': {}}
+
 # Question types
-QUESTION_TYPES = [
+QUESTION_TYPES = (
     'age',           # Which company is older
     'employees',     # Which has more employees
     'revenue',       # Which has higher revenue
@@ -35,12 +68,12 @@ QUESTION_TYPES = [
     'activity',      # Which company does [activity]
     'legal_form',    # Which is OÜ/AS/MTÜ
     'vat',           # Which has VAT number
-]
+)
 
 
-def get_complete_companies():
+def get_complete_companies(require_vat=True):
     """Get queryset of companies with all fields populated."""
-    return Company.objects.exclude(
+    qs = Company.objects.exclude(
         name=''
     ).exclude(
         registry_code=''
@@ -59,207 +92,228 @@ def get_complete_companies():
         revenue__isnull=False,
         profit__isnull=False,
         labor_taxes__isnull=False,
-    ).exclude(
-        vat_number=''
     )
+    return qs.exclude(vat_number='') if require_vat else qs
 
 
-def parse_date(date_str):
-    """Parse Estonian date format DD.MM.YYYY to datetime."""
-    if not date_str:
-        return None
-    try:
-        return datetime.strptime(date_str, '%d.%m.%Y')
-    except ValueError:
-        return None
+def _refresh_eligible_ids():
+    """Reload the ids of all complete companies and their buckets into the cache."""
+    columns = list(BUCKET_FIELDS.values())
+    ids = []
+    no_vat_ids = []
+    buckets = {column: defaultdict(list) for column in columns}
+    # order_by() drops Meta.ordering; sorting every complete company by name is wasted work
+    rows = get_complete_companies(require_vat=False).order_by().values_list('id', 'vat_number', *columns)
+    for row in rows:
+        if not row[1]:
+            no_vat_ids.append(row[0])
+            continue
+        ids.append(row[0])
+        for column, value in zip(columns, row[2:]):
+            if value:
+                buckets[column][value].append(row[0])
+    _ELIGIBLE_IDS_CACHE['ids'] = ids
+    _ELIGIBLE_IDS_CACHE['no_vat_ids'] = no_vat_ids
+    _ELIGIBLE_IDS_CACHE['buckets'] = {
+        column: (list(bucket), dict(bucket)) for column, bucket in buckets.items()
+    }
+    _ELIGIBLE_IDS_CACHE['ts'] = time.monotonic()
 
 
-def get_year_from_date(date_str):
-    """Extract year from date string."""
-    dt = parse_date(date_str)
-    return dt.year if dt else None
+def _ensure_fresh():
+    """Reload the cache if it was invalidated or is older than the TTL."""
+    if not _ELIGIBLE_IDS_CACHE['ts'] or time.monotonic() - _ELIGIBLE_IDS_CACHE['ts'] > ELIGIBLE_IDS_TTL:
+        _refresh_eligible_ids()
 
 
-def extract_county_name(county_str):
-    """Extract county name from county field.
-    
-    Format is typically: "address, city, COUNTY maakond"
-    Returns normalized county name (e.g., 'harju' from 'Harju maakond')
-    """
-    if not county_str:
+def get_eligible_ids():
+    """Get cached ids of complete companies, reloading them after the TTL."""
+    _ensure_fresh()
+    return _ELIGIBLE_IDS_CACHE['ids']
+
+
+def get_no_vat_ids():
+    """Get cached ids of complete companies that have no VAT number."""
+    _ensure_fresh()
+    return _ELIGIBLE_IDS_CACHE['no_vat_ids']
+
+
+def get_bucket(column):
+    """Get cached (values, {value: [ids]}) for a BUCKET_FIELDS column."""
+    _ensure_fresh()
+    return _ELIGIBLE_IDS_CACHE['buckets'][column]
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def invalidate_eligible_ids(sender, **kwargs):
+    """Reload the cache on the next question after a company changes."""
+    _ELIGIBLE_IDS_CACHE['ts'] = 0
+
+
+def sample_candidates(recent, *fields, k=CANDIDATE_SAMPLE_SIZE):
+    """Fetch up to k random complete companies not in recent, as dicts of id and the given fields."""
+    ids = get_eligible_ids()
+    sample_ids = [i for i in random.sample(ids, min(k, len(ids))) if i not in recent]
+    # Already in random order, skip the ORDER BY name from Meta.ordering
+    return list(Company.objects.filter(id__in=sample_ids).order_by().values('id', *fields))
+
+
+def random_pair(n):
+    """Pick two distinct random indexes below n with two RNG draws."""
+    i = random.randrange(n)
+    j = random.randrange(n - 1)
+    return (i, n - 1) if j == i else (i, j)
+
+
+def _choose_id(ids, recent):
+    """Pick a random id from ids that isn't in recent, or None."""
+    start = random.randrange(len(ids))
+    # At most len(recent) ids can be skipped, so this many steps always suffice
+    for offset in range(min(len(ids), len(recent) + 1)):
+        company_id = ids[(start + offset) % len(ids)]
+        if company_id not in recent:
+            return company_id
+    return None
+
+
+def pick_pair_from_buckets(column, recent):
+    """Pick candidates from two random buckets, so their column values differ."""
+    values, bucket = get_bucket(column)
+    if len(values) < 2:
         return None
-    # Extract the last part after final comma (the county)
-    parts = [p.strip() for p in county_str.split(',')]
-    if not parts:
+    i, j = random_pair(len(values))
+    value1, value2 = values[i], values[j]
+    id1 = _choose_id(bucket[value1], recent)
+    id2 = _choose_id(bucket[value2], recent)
+    if id1 is None or id2 is None:
         return None
-    
-    # Get the last part which should be "COUNTY maakond"
-    county_part = parts[-1]
-    # Remove "maakond" suffix and normalize
-    county = county_part.replace(' maakond', '').strip().lower()
-    return county if county else None
+    return {'id': id1}, {'id': id2}
+
+
+def fetch_pair(pair):
+    """Load the full Company rows for a (correct, wrong) pair of candidate dicts."""
+    if not pair:
+        return None
+    correct_id, wrong_id = pair[0]['id'], pair[1]['id']
+    companies = Company.objects.order_by().in_bulk([correct_id, wrong_id])
+    if correct_id not in companies or wrong_id not in companies:
+        return None
+    return companies[correct_id], companies[wrong_id]
 
 
 def get_available_question_types(recent_types):
     """Get question types not in recent cooldown."""
-    available = [t for t in QUESTION_TYPES if t not in recent_types[-TYPE_COOLDOWN:]]
-    return available if available else QUESTION_TYPES
+    recent = set(recent_types[-TYPE_COOLDOWN:])
+    available = [t for t in QUESTION_TYPES if t not in recent]
+    return available if available else list(QUESTION_TYPES)
 
 
-def get_companies_for_question(q_type, recent_company_ids):
-    """Get two suitable companies for a question type."""
-    
-    # Base queryset - only complete companies, exclude recent ones
-    base_qs = get_complete_companies().exclude(id__in=recent_company_ids[-COMPANY_COOLDOWN:])
-    
-    if q_type == 'age':
-        # Need companies with valid dates, 7+ years apart
-        companies = list(base_qs.exclude(registered_date='').order_by('?')[:500])
-        random.shuffle(companies)
-        
-        for c1 in companies:
-            year1 = get_year_from_date(c1.registered_date)
-            if not year1:
-                continue
-            for c2 in companies:
-                if c1.id == c2.id:
-                    continue
-                year2 = get_year_from_date(c2.registered_date)
-                if year2 and abs(year1 - year2) >= MIN_DIFF['years']:
-                    return (c1, c2) if year1 < year2 else (c2, c1)  # older first
-        return None
-    
-    elif q_type == 'employees':
-        # Need companies with employee data, 20+ difference
-        companies = list(base_qs.filter(employees__isnull=False).order_by('?')[:500])
-        random.shuffle(companies)
-        
-        for c1 in companies:
-            for c2 in companies:
-                if c1.id == c2.id:
-                    continue
-                if c1.employees is not None and c2.employees is not None:
-                    diff = abs(c1.employees - c2.employees)
-                    if diff >= MIN_DIFF['employees']:
-                        return (c1, c2) if c1.employees > c2.employees else (c2, c1)
-        return None
-    
-    elif q_type == 'revenue':
-        companies = list(base_qs.filter(revenue__isnull=False).order_by('?')[:500])
-        random.shuffle(companies)
-        
-        for c1 in companies:
-            for c2 in companies:
-                if c1.id == c2.id:
-                    continue
-                if c1.revenue is not None and c2.revenue is not None:
-                    diff = abs(c1.revenue - c2.revenue)
-                    if diff >= MIN_DIFF['revenue']:
-                        return (c1, c2) if c1.revenue > c2.revenue else (c2, c1)
+def _pick_pair_by_metric(companies, key, min_diff):
+    """Pick a random (higher, lower) pair whose key values differ by min_diff or more.
+
+    Sorts the candidates once and bisects for partners instead of comparing
+    every pair. Companies whose key is None are skipped.
+    """
+    keyed = sorted(
+        ((k, c) for c in companies if (k := key(c)) is not None),
+        key=lambda kc: kc[0],
+    )
+    if not keyed:
         return None
-    
-    elif q_type == 'profit':
-        companies = list(base_qs.filter(profit__isnull=False).order_by('?')[:500])
-        random.shuffle(companies)
-        
-        for c1 in companies:
-            for c2 in companies:
-                if c1.id == c2.id:
-                    continue
-                if c1.profit is not None and c2.profit is not None:
-                    diff = abs(c1.profit - c2.profit)
-                    if diff >= MIN_DIFF['profit']:
-                        return (c1, c2) if c1.profit > c2.profit else (c2, c1)
+    keys = [k for k, _ in keyed]
+    # Only values at least min_diff below the maximum have a partner
+    i_max = bisect_right(keys, keys[-1] - min_diff)
+    if not i_max:
         return None
+    i = random.randrange(i_max)
+    j_min = bisect_left(keys, keys[i] + min_diff, lo=i + 1)
+    j = random.randrange(j_min, len(keys))
+    return keyed[j][1], keyed[i][1]
+
+
+def get_companies_for_question(q_type, recent):
+    """Get two suitable companies for a question type, skipping ids in recent."""
+    return fetch_pair(pick_candidate_pair(q_type, recent))
+
+
+def _make_metric_picker(field, min_diff, lower_first=False):
+    """Build a handler for questions about which company has more of a numeric field."""
+    key = itemgetter(field)
     
-    elif q_type == 'labor_taxes':
-        companies = list(base_qs.filter(labor_taxes__isnull=False).order_by('?')[:500])
-        random.shuffle(companies)
-        
-        for c1 in companies:
-            for c2 in companies:
-                if c1.id == c2.id:
-                    continue
-                if c1.labor_taxes is not None and c2.labor_taxes is not None:
-                    diff = abs(c1.labor_taxes - c2.labor_taxes)
-                    if diff >= MIN_DIFF['labor_taxes']:
-                        return (c1, c2) if c1.labor_taxes > c2.labor_taxes else (c2, c1)
-        return None
+    def picker(recent):
+        pair = _pick_pair_by_metric(sample_candidates(recent, field), key, min_diff)
+        return pair[::-1] if pair and lower_first else pair
     
-    elif q_type == 'county':
-        # Find two companies in different counties
-        companies = list(base_qs.exclude(county='').order_by('?')[:500])
-        random.shuffle(companies)
-        
-        for c1 in companies:
-            county1 = extract_county_name(c1.county)
-            if not county1:
-                continue
-            for c2 in companies:
-                if c1.id == c2.id:
-                    continue
-                county2 = extract_county_name(c2.county)
-                if county2 and county1 != county2:
-                    return (c1, c2)  # c1 is correct (has the county we'll ask about)
-        return None
+    return picker
+
+
+def _make_bucket_picker(column):
+    """Build a handler for questions needing two companies with different column values.
     
-    elif q_type == 'ceo':
-        # Find two companies with different CEOs
-        companies = list(base_qs.exclude(ceo='').order_by('?')[:500])
-        random.shuffle(companies)
-        
-        for c1 in companies:
-            for c2 in companies:
-                if c1.id == c2.id:
-                    continue
-                if c1.ceo != c2.ceo:
-                    return (c1, c2)
-        return None
+    The first company is correct (has the value we'll ask about).
+    """
+    def picker(recent):
+        return pick_pair_from_buckets(column, recent)
     
-    elif q_type == 'activity':
-        # Find two companies with different activities
-        companies = list(base_qs.exclude(activity='').order_by('?')[:500])
-        random.shuffle(companies)
-        
-        for c1 in companies:
-            for c2 in companies:
-                if c1.id == c2.id:
-                    continue
-                if c1.activity != c2.activity:
-                    return (c1, c2)
+    return picker
+
+
+def _pick_vat(recent):
+    """One with VAT, one without."""
+    with_vat, without_vat = get_eligible_ids(), get_no_vat_ids()
+    if not with_vat or not without_vat:
         return None
-    
-    elif q_type == 'legal_form':
-        # Find two companies with different legal forms
-        companies = list(base_qs.exclude(legal_form='').order_by('?')[:500])
-        random.shuffle(companies)
-        
-        for c1 in companies:
-            for c2 in companies:
-                if c1.id == c2.id:
-                    continue
-                if c1.legal_form != c2.legal_form:
-                    return (c1, c2)
+    id1 = _choose_id(with_vat, recent)
+    id2 = _choose_id(without_vat, recent)
+    if id1 is None or id2 is None:
         return None
-    
-    elif q_type == 'vat':
-        # One with VAT, one without
-        c1 = base_qs.exclude(vat_number='').order_by('?').first()
-        if not c1:
-            return None
-        c2 = base_qs.filter(vat_number='').order_by('?').first()
-        if not c2:
-            return None
-        return (c1, c2)
-    
-    return None
+    return {'id': id1}, {'id': id2}
+
+
+# Candidate pair handler per question type; each returns (correct, wrong) dicts or None
+HANDLERS = {
+    # Older first: the correct company has the lower registration year
+    'age': _make_metric_picker('registered_year', MIN_DIFF['years'], lower_first=True),
+    'employees': _make_metric_picker('employees', MIN_DIFF['employees']),
+    'revenue': _make_metric_picker('revenue', MIN_DIFF['revenue']),
+    'profit': _make_metric_picker('profit', MIN_DIFF['profit']),
+    'labor_taxes': _make_metric_picker('labor_taxes', MIN_DIFF['labor_taxes']),
+    **{q_type: _make_bucket_picker(column) for q_type, column in BUCKET_FIELDS.items()},
+    'vat': _pick_vat,
+}
+
+
+def pick_candidate_pair(q_type, recent):
+    """Pick (correct, wrong) candidate dicts for a question type."""
+    handler = HANDLERS.get(q_type)
+    return handler(recent) if handler else None
+
+
+def company_display(company):
+    """Snapshot a company's DISPLAY_FIELDS as a JSON-serializable dict."""
+    data = {}
+    for field in DISPLAY_FIELDS:
+        value = getattr(company, field)
+        data[field] = str(value) if isinstance(value, Decimal) else value
+    return data
+
+
+def _format_euro(amount):
+    """Format a euro amount for question text, e.g. '2.5 miljonit' or '300 tuhat'."""
+    amount = int(amount)
+    if amount >= 1000000:
+        return f"{amount / 1000000:.1f} {MILLION}"
+    if amount >= 1000:
+        return f"{amount / 1000:.0f} {THOUSAND}"
+    return str(amount)
 
 
 def generate_question_text(q_type, correct_company):
     """Generate the question text with answer embedded in question."""
     
     if q_type == 'age':
-        year = get_year_from_date(correct_company.registered_date)
+        year = correct_company.registered_year
         if year:
             return f"Milline ettevõte asutati aastal {year}?"
         return "Milline ettevõte on vanem?"
@@ -269,39 +323,17 @@ def generate_question_text(q_type, correct_company):
         return f"Millisel ettevõttel on {employees} töötajat?"
     
     elif q_type == 'revenue':
-        revenue = int(correct_company.revenue)
-        # Format large numbers nicely
-        if revenue >= 1000000:
-            revenue_str = f"{revenue / 1000000:.1f} miljonit"
-        elif revenue >= 1000:
-            revenue_str = f"{revenue / 1000:.0f} tuhat"
-        else:
-            revenue_str = str(revenue)
-        return f"Millisel ettevõttel on käive {revenue_str} eurot?"
+        return f"Millisel ettevõttel on käive {_format_euro(correct_company.revenue)} eurot?"
     
     elif q_type == 'profit':
-        profit = int(correct_company.profit)
-        if profit >= 1000000:
-            profit_str = f"{profit / 1000000:.1f} miljonit"
-        elif profit >= 1000:
-            profit_str = f"{profit / 1000:.0f} tuhat"
-        else:
-            profit_str = str(profit)
-        return f"Millisel ettevõttel on kasum {profit_str} eurot?"
+        return f"Millisel ettevõttel on kasum {_format_euro(correct_company.profit)} eurot?"
     
     elif q_type == 'labor_taxes':
-        labor_taxes = int(correct_company.labor_taxes)
-        if labor_taxes >= 1000000:
-            taxes_str = f"{labor_taxes / 1000000:.1f} miljonit"
-        elif labor_taxes >= 1000:
-            taxes_str = f"{labor_taxes / 1000:.0f} tuhat"
-        else:
-            taxes_str = str(labor_taxes)
-        return f"Millisel ettevõttel on tööjõukulud {taxes_str} eurot?"
+        return f"Millisel ettevõttel on tööjõukulud {_format_euro(correct_company.labor_taxes)} eurot?"
     
     elif q_type == 'county':
         # Extract county name using our helper function
-        county_name = extract_county_name(correct_company.county)
+        county_name = correct_company.county_normalized
         if county_name:
             # Capitalize first letter for display
             county_display = county_name.capitalize() + " maakond"
@@ -332,16 +364,18 @@ def generate_question(session):
     
     # Get available question types
     available_types = get_available_question_types(recent_types)
+    # Companies on cooldown, shared by every type attempt below
+    recent = set(recent_company_ids[-COMPANY_COOLDOWN:])
     random.shuffle(available_types)
     
     # Try each type until we find valid companies
     for q_type in available_types:
-        result = get_companies_for_question(q_type, recent_company_ids)
+        result = get_companies_for_question(q_type, recent)
         if result:
             correct_company, wrong_company = result
             
             # Randomly position correct answer (left or right)
-            if random.choice([True, False]):
+            if random.getrandbits(1):
                 company_a, company_b = correct_company, wrong_company
                 correct_position = 'a'
             else:
@@ -351,23 +385,23 @@ def generate_question(session):
             # Generate question text
             question_text = generate_question_text(q_type, correct_company)
             
-            # Update session
-            recent_types.append(q_type)
-            recent_company_ids.extend([correct_company.id, wrong_company.id])
-            
-            # Keep only recent items
-            session['recent_types'] = recent_types[-TYPE_COOLDOWN:]
-            session['recent_company_ids'] = recent_company_ids[-COMPANY_COOLDOWN * 2:]
-            
-            # Store current question
-            session['current_question'] = {
-                'type': q_type,
-                'text': question_text,
-                'company_a_id': company_a.id,
-                'company_b_id': company_b.id,
-                'correct_position': correct_position,
-                'correct_company_id': correct_company.id,
-            }
+            # Update session in one go, keeping only recent items
+            session.update({
+                'recent_types': (recent_types + [q_type])[-TYPE_COOLDOWN:],
+                'recent_company_ids': (
+                    recent_company_ids + [correct_company.id, wrong_company.id]
+                )[-COMPANY_COOLDOWN * 2:],
+                'current_question': {
+                    'type': q_type,
+                    'text': question_text,
+                    'company_a_id': company_a.id,
+                    'company_b_id': company_b.id,
+                    'correct_position': correct_position,
+                    'correct_company_id': correct_company.id,
+                    'company_a_display': company_display(company_a),
+                    'company_b_display': company_display(company_b),
+                },
+            })
             
             return {
                 'text': question_text,
@@ -379,17 +413,25 @@ def generate_question(session):
     return None
 
 
+def new_game_state():
+    """Session values for a fresh game."""
+    return {
+        'score': 0,
+        'recent_types': [],
+        'recent_company_ids': [],
+        'current_question': None,
+        'feedback': None,
+        'promo_shown': False,
+        'show_promo': False,
+    }
+
+
 def index(request):
     """Main game view."""
     
     # Initialize session if needed
     if 'score' not in request.session:
-        request.session['score'] = 0
-        request.session['recent_types'] = []
-        request.session['recent_company_ids'] = []
-        request.session['current_question'] = None
-        request.session['feedback'] = None
-        request.session['promo_shown'] = False
+        request.session.update(new_game_state())
     
     feedback = request.session.get('feedback')
     show_promo = False
@@ -398,7 +440,6 @@ def index(request):
     if request.GET.get('continue') == '1':
         request.session['feedback'] = None
         feedback = None
-        request.session.modified = True
     
     context = {
         'score': request.session['score'],
@@ -414,30 +455,23 @@ def index(request):
         
         if current_q and answer:
             correct = answer == current_q['correct_position']
-            old_score = request.session['score']
-            
-            if correct:
-                request.session['score'] += 1
-                request.session['feedback'] = {
-                    'correct': True,
+            # Wrong answer = -1 point
+            score = request.session['score'] + (1 if correct else -1)
+            updates = {
+                'score': score,
+                'feedback': {
+                    'correct': correct,
                     'selected': answer,
                     'correct_position': current_q['correct_position'],
-                }
-            else:
-                # Wrong answer = -1 point
-                request.session['score'] -= 1
-                request.session['feedback'] = {
-                    'correct': False,
-                    'selected': answer,
-                    'correct_position': current_q['correct_position'],
-                }
+                },
+            }
             
             # Check if should show promo (hit 5 points for first time)
-            if request.session['score'] >= PROMO_THRESHOLD and not request.session.get('promo_shown', False):
-                request.session['show_promo'] = True
-                request.session['promo_shown'] = True
+            if score >= PROMO_THRESHOLD and not request.session.get('promo_shown', False):
+                updates['show_promo'] = True
+                updates['promo_shown'] = True
             
-            request.session.modified = True
+            request.session.update(updates)
             return redirect('index')
     
     # If showing feedback, display the same question with the same companies
@@ -446,25 +480,27 @@ def index(request):
         if current_q:
             context['question'] = current_q['text']
             context['question_type'] = current_q.get('type')
-            try:
-                company_a = Company.objects.get(id=current_q['company_a_id'])
-                company_b = Company.objects.get(id=current_q['company_b_id'])
-                context['company_a'] = company_a
-                context['company_b'] = company_b
-            except Company.DoesNotExist:
-                pass
+            if 'company_a_display' in current_q:
+                # Render from the snapshot taken when the question was asked
+                context['company_a'] = current_q['company_a_display']
+                context['company_b'] = current_q['company_b_display']
+            else:
+                # Question stored before display snapshots were kept
+                companies = Company.objects.order_by().in_bulk([current_q['company_a_id'], current_q['company_b_id']])
+                if current_q['company_a_id'] in companies and current_q['company_b_id'] in companies:
+                    context['company_a'] = companies[current_q['company_a_id']]
+                    context['company_b'] = companies[current_q['company_b_id']]
         
         # Check if should show promo popup
+        updates = {'feedback': None}  # Clear feedback for next request
         if request.session.get('show_promo', False):
             context['show_promo'] = True
-            request.session['show_promo'] = False
+            updates['show_promo'] = False
         
         # Update score in context
         context['score'] = request.session['score']
         
-        # Clear feedback for next request
-        request.session['feedback'] = None
-        request.session.modified = True
+        request.session.update(updates)
         return render(request, 'a_main/index.html', context)
     
     # Generate new question
@@ -481,18 +517,10 @@ def index(request):
     else:
         context['error'] = 'Ei suutnud küsimust genereerida. Proovi uuesti.'
     
-    request.session.modified = True
     return render(request, 'a_main/index.html', context)
 
 
 def reset_game(request):
     """Reset the game state."""
-    request.session['score'] = 0
-    request.session['recent_types'] = []
-    request.session['recent_company_ids'] = []
-    request.session['current_question'] = None
-    request.session['feedback'] = None
-    request.session['promo_shown'] = False
-    request.session['show_promo'] = False
-    request.session.modified = True
+    request.session.update(new_game_state())
     return redirect('index')
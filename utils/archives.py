@@ -0,0 +1,78 @@
+"""
+Readers for the CSV and JSON files inside the registry's open data archives.
+Shared by utils/scraper.py and the import_companies management command.
+"""
+
+import csv
+import json
+import operator
+import re
+from typing import IO, Any, Iterator
+
+JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+
+def read_csv_columns(f: IO[str], columns: tuple[str, ...], source: str, delimiter: str = ';') -> Iterator[tuple]:
+    """Stream rows of a CSV text stream as tuples of the requested columns.
+    
+    Raises ValueError naming source if any column is missing from the header.
+    """
+    reader = csv.reader(f, delimiter=delimiter)
+    header = next(reader, [])
+    missing = [c for c in columns if c not in header]
+    if missing:
+        raise ValueError(f"Missing CSV columns in {source}: {', '.join(missing)}")
+    # Resolve column positions once, then pick fields by index per row;
+    # blank lines come through as [] and are skipped
+    yield from map(operator.itemgetter(*(header.index(c) for c in columns)), filter(None, reader))
+
+
+def read_json_array(f: IO[str], source: str, chunk_size: int = 1 << 20) -> Iterator[Any]:
+    """Stream items of a top-level JSON array from a text stream, one at a time.
+    
+    Only chunk_size characters plus the item being decoded are held in memory.
+    Raises ValueError naming source if the stream isn't a JSON array.
+    """
+    decoder = json.JSONDecoder()
+    buf, pos, eof = '', 0, False
+    expect = '['  # One of '[', 'item', ','
+    while True:
+        pos = JSON_WHITESPACE.match(buf, pos).end()
+        if pos == len(buf) and not eof:
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buf, pos = buf[pos:] + chunk, 0
+            continue
+        char = buf[pos:pos + 1]
+        if expect == '[':
+            if char != '[':
+                raise ValueError(f"Expected a JSON array in {source}")
+            pos += 1
+            expect = 'item'
+        elif char == ']':
+            return
+        elif expect == ',':
+            if char != ',':
+                raise ValueError(f"Malformed JSON array in {source}")
+            pos += 1
+            expect = 'item'
+        else:
+            # Decode one item; on a partial item, read more and retry
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                item, end = None, len(buf)
+            # An item counts as complete only once the ',' or ']' after it is
+            # buffered: a number cut at the chunk boundary ("1." + "5") also
+            # decodes, just too early
+            end = JSON_WHITESPACE.match(buf, end).end()
+            if not eof and (end == len(buf) or buf[end] not in ',]'):
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+            yield item
+            pos = end
+            expect = ','
@@ -12,10 +12,40 @@ Data includes:
 import requests
 import zipfile
 import io
-import csv
+import functools
+import hashlib
+import itertools
 import json
+import os
+import re
+import shutil
+import sys
+import threading
 from collections import defaultdict
-from typing import Optional
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Iterator, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from utils.archives import read_csv_columns, read_json_array
+except ImportError:
+    # Run as a script, with utils/ itself on sys.path
+    from archives import read_csv_columns, read_json_array
+
+try:
+    # SIMD-accelerated drop-in for zlib (pip install zlib-ng). zipfile looks up
+    # its DEFLATE objects through the module-level zlib name at call time, but
+    # binds crc32 once at import, so both need replacing
+    from zlib_ng import zlib_ng
+except ImportError:
+    pass
+else:
+    zipfile.zlib = zlib_ng
+    zipfile.crc32 = zlib_ng.crc32
 
 
 # Open Data Base URL
@@ -34,112 +64,258 @@ DATASETS = {
     "reports_elements_2023": f"{BASE_URL}/sites/default/files/4.2023_aruannete_elemendid_kuni_31122025_0.zip",
 }
 
+# Datasets downloaded in the main process while the workers parse; the 2023 elements are only a fallback
+PREFETCH = ("reports_elements_2024",)
 
-def download_zip(url: str) -> bytes:
-    """Download a zip file and return its content as bytes."""
-    filename = url.split('/')[-1]
-    print(f"  Downloading: {filename}")
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (compatible; Estonian Business Data Fetcher)'
-    }
+# Independent download + parse steps, each run in its own worker process
+PARALLEL_STEPS = ("basic", "persons", "reports")
+
+# Downloaded archives are kept here and revalidated with conditional GETs
+CACHE_DIR = Path(os.environ.get("SCRAPER_CACHE_DIR", Path.home() / ".cache" / "ariregister"))
+
+# Serializes log lines from download threads within one process; see log()
+PRINT_LOCK = threading.Lock()
+
+# One keep-alive connection pool per process for all downloads from BASE_URL
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = 'Mozilla/5.0 (compatible; Estonian Business Data Fetcher)'
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=1),
+))
+
+# Basic data columns in the order fetch_basic_data unpacks them
+BASIC_COLUMNS = (
+    "ariregistri_kood",
+    "nimi",
+    "ettevotja_oiguslik_vorm",
+    "ettevotja_oigusliku_vormi_alaliik",
+    "ettevotja_staatus",
+    "ettevotja_staatus_tekstina",
+    "ettevotja_esmakande_kpv",
+    "ads_normaliseeritud_taisaadress",
+    "asukoht_ettevotja_aadressis",
+    "asukoha_ehak_tekstina",
+    "indeks_ettevotja_aadressis",
+    "kmkr_nr",
+    "teabesysteemi_link",
+)
+# Company fields filled from the basic data, in dataclass order
+BASIC_FIELDS = (
+    "reg_code",
+    "name",
+    "legal_form",
+    "legal_form_subtype",
+    "status",
+    "status_text",
+    "first_entry_date",
+    "address",
+    "county",
+    "postal_code",
+    "vat_number",
+    "registry_link",
+)
+REPORT_COLUMNS = ("report_id", "registrikood", "aruandeaast")
+ELEMENT_COLUMNS = ("report_id", "elemendi_label", "vaartus")
+
+# Annual report element labels mapped to financial fields; the consolidated
+# revenue is only used when a company has no plain revenue element
+FINANCIAL_LABELS = {
+    "Müügitulu": "revenue",
+    "Müügitulu Konsolideeritud": "consolidated_revenue",
+    "Aruandeaasta kasum (kahjum)": "profit",
+}
+# Matched as a substring, excluding consolidated figures
+EMPLOYEES_LABEL = "Töötajate keskmine arv"
+
+# CEO-like role codes, highest priority first
+CEO_ROLES = ("JUHL", "JUHATUSE LIIGE", "JUHATUSE ESIMEES", "JUHATAJA", "DIREKTOR", "PROKURIST")
+CEO_ROLE_PRIORITY = {role: i for i, role in enumerate(CEO_ROLES)}
+CEO_ROLE_RE = re.compile("|".join(map(re.escape, sorted(CEO_ROLES, key=len, reverse=True))))
+
+
+@dataclass(slots=True)
+class Company:
+    """One company record; slots keep 400k of these far smaller than dicts."""
+    reg_code: str
+    name: str
+    legal_form: str
+    legal_form_subtype: str
+    status: str
+    status_text: str
+    first_entry_date: str
+    address: str
+    county: str
+    postal_code: str
+    vat_number: str
+    registry_link: str
+    # Filled from other datasets
+    ceo: Optional[str] = None
+    board_members: list[str] = field(default_factory=list)
+    employees: Optional[float] = None
+    revenue: Optional[str] = None
+    profit: Optional[str] = None
+    report_year: Optional[int] = None
+
+
+def log(message: str):
+    """Print one progress line without interleaving with other threads or processes.
     
-    response = requests.get(url, headers=headers, timeout=600)
-    response.raise_for_status()
+    Worker processes share stdout but not PRINT_LOCK, so the line and its newline
+    go out in a single write and are flushed at once, unlike print().
+    """
+    with PRINT_LOCK:
+        sys.stdout.write(message + "\n")
+        sys.stdout.flush()
+
+
+def download_zip(url: str) -> IO[bytes]:
+    """Download a zip file into the local cache and return it opened for reading.
     
-    return response.content
+    A cached copy is revalidated with If-None-Match / If-Modified-Since and
+    reused when the server answers 304 Not Modified.
+    """
+    filename = url.split('/')[-1]
+    key = hashlib.sha1(url.encode()).hexdigest()
+    path = CACHE_DIR / f"{key}.zip"
+    meta_path = CACHE_DIR / f"{key}.json"
+    
+    headers = {}
+    meta = {}
+    if path.exists() and meta_path.exists():
+        meta = json.loads(meta_path.read_text())
+        if meta.get("etag"):
+            headers['If-None-Match'] = meta["etag"]
+        if meta.get("last_modified"):
+            headers['If-Modified-Since'] = meta["last_modified"]
+    
+    with SESSION.get(url, headers=headers, stream=True, timeout=600) as response:
+        if response.status_code == 304:
+            log(f"  Using cached: {filename}")
+            return path.open('rb')
+        response.raise_for_status()
+        
+        log(f"  Downloading: {filename}")
+        # Stream to disk instead of holding the whole archive in memory; write
+        # next to the cache entry and rename, so an aborted run can't leave a
+        # truncated archive behind
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        part = path.with_suffix(".part")
+        response.raw.decode_content = True
+        with part.open('wb') as f:
+            shutil.copyfileobj(response.raw, f, length=1 << 20)
+        part.replace(path)
+        meta_path.write_text(json.dumps({
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }))
+    
+    return path.open('rb')
 
 
-def extract_csv_from_zip(zip_content: bytes, delimiter: str = ';') -> list[dict]:
-    """Extract and parse CSV file from zip content."""
-    with zipfile.ZipFile(io.BytesIO(zip_content)) as zf:
+def extract_csv_from_zip(zip_file: IO[bytes], columns: tuple[str, ...], delimiter: str = ';') -> Iterator[tuple]:
+    """Stream CSV rows from a zip archive as tuples of the requested columns.
+    
+    Closes the archive when done.
+    """
+    with zip_file, zipfile.ZipFile(zip_file) as zf:
         csv_files = [f for f in zf.namelist() if f.endswith('.csv')]
         if not csv_files:
             raise ValueError("No CSV file found in archive")
         
         csv_filename = csv_files[0]
-        print(f"    Extracting: {csv_filename}")
+        log(f"    Extracting: {csv_filename}")
         
-        with zf.open(csv_filename) as csvfile:
-            content = csvfile.read().decode('utf-8-sig')
-            reader = csv.DictReader(io.StringIO(content), delimiter=delimiter)
-            return list(reader)
+        with zf.open(csv_filename) as raw, io.TextIOWrapper(raw, encoding='utf-8-sig', newline='') as csvfile:
+            yield from read_csv_columns(csvfile, columns, csv_filename, delimiter)
 
 
-def extract_json_from_zip(zip_content: bytes) -> list[dict]:
-    """Extract and parse JSON file from zip content."""
-    with zipfile.ZipFile(io.BytesIO(zip_content)) as zf:
+def extract_json_from_zip(zip_file: IO[bytes], chunk_size: int = 1 << 20) -> Iterator[dict]:
+    """Stream items of the top-level JSON array in a zip archive, one at a time.
+    
+    Closes the archive when done.
+    """
+    with zip_file, zipfile.ZipFile(zip_file) as zf:
         json_files = [f for f in zf.namelist() if f.endswith('.json')]
         if not json_files:
             raise ValueError("No JSON file found in archive")
         
         json_filename = json_files[0]
-        print(f"    Extracting: {json_filename}")
+        log(f"    Extracting: {json_filename}")
         
-        with zf.open(json_filename) as jsonfile:
-            content = jsonfile.read().decode('utf-8-sig')
-            return json.loads(content)
+        with zf.open(json_filename) as raw, io.TextIOWrapper(raw, encoding='utf-8-sig') as jsonfile:
+            yield from read_json_array(jsonfile, json_filename, chunk_size)
 
 
-def fetch_basic_data(limit: Optional[int] = None) -> dict[str, dict]:
+def fetch_basic_data(limit: Optional[int] = None, download: Optional[Future] = None) -> dict[str, list[str]]:
     """
     Fetch basic company data with correct column mappings.
-    Returns dict keyed by registry code.
+    Returns one list per BASIC_FIELDS entry, row-aligned; build_companies turns
+    them into records. Plain lists of strings are cheap to pickle back from a
+    worker process, unlike a dict of Company objects.
     """
-    zip_content = download_zip(DATASETS["basic_csv"])
-    data = extract_csv_from_zip(zip_content)
-    
-    print(f"    Loaded {len(data)} rows")
-    
-    companies = {}
-    for i, row in enumerate(data):
-        if limit and i >= limit:
-            break
+    zip_file = download.result() if download else download_zip(DATASETS["basic_csv"])
+    data = extract_csv_from_zip(zip_file, BASIC_COLUMNS)
+    
+    columns = {field: [] for field in BASIC_FIELDS}
+    (add_reg_code, add_name, add_legal_form, add_legal_form_subtype, add_status, add_status_text,
+     add_first_entry_date, add_address, add_county, add_postal_code, add_vat_number,
+     add_registry_link) = (columns[field].append for field in BASIC_FIELDS)
+    # Low-cardinality fields share one str object per distinct value
+    pool = {}
+    intern = pool.setdefault
+    rows = 0
+    for row in itertools.islice(data, limit or None):
+        rows += 1
         
-        reg_code = row.get("ariregistri_kood", "").strip()
+        # One C-level pass strips every column instead of a .strip() call per field
+        (reg_code, name, legal_form, legal_form_subtype, status, status_text, first_entry_date,
+         normalized_address, address, county, postal_code, vat_number, registry_link) = map(str.strip, row)
         if not reg_code:
             continue
         
-        companies[reg_code] = {
-            "reg_code": reg_code,
-            "name": row.get("nimi", "").strip(),
-            "legal_form": row.get("ettevotja_oiguslik_vorm", "").strip(),
-            "legal_form_subtype": row.get("ettevotja_oigusliku_vormi_alaliik", "").strip(),
-            "status": row.get("ettevotja_staatus", "").strip(),
-            "status_text": row.get("ettevotja_staatus_tekstina", "").strip(),
-            "first_entry_date": row.get("ettevotja_esmakande_kpv", "").strip(),
-            "address": row.get("ads_normaliseeritud_taisaadress", "").strip() or row.get("asukoht_ettevotja_aadressis", "").strip(),
-            "county": row.get("asukoha_ehak_tekstina", "").strip(),
-            "postal_code": row.get("indeks_ettevotja_aadressis", "").strip(),
-            "vat_number": row.get("kmkr_nr", "").strip(),
-            "registry_link": row.get("teabesysteemi_link", "").strip(),
-            # Initialize fields to be filled from other datasets
-            "ceo": None,
-            "board_members": [],
-            "employees": None,
-            "revenue": None,
-            "profit": None,
-            "report_year": None,
-        }
-    
-    return companies
+        add_reg_code(reg_code)
+        add_name(name)
+        add_legal_form(intern(legal_form, legal_form))
+        add_legal_form_subtype(intern(legal_form_subtype, legal_form_subtype))
+        add_status(intern(status, status))
+        add_status_text(intern(status_text, status_text))
+        add_first_entry_date(first_entry_date)
+        add_address(normalized_address or address)
+        add_county(intern(county, county))
+        add_postal_code(postal_code)
+        add_vat_number(vat_number)
+        add_registry_link(registry_link)
+    
+    log(f"    Loaded {rows} rows")
+    
+    return columns
+
 
+def build_companies(columns: dict[str, list[str]]) -> dict[str, Company]:
+    """Build Company records from fetch_basic_data's columns, keyed by registry code."""
+    # A repeated registry code keeps its last row, as assigning row by row did
+    return {values[0]: Company(*values) for values in zip(*(columns[field] for field in BASIC_FIELDS))}
 
-def fetch_persons_data(limit: Optional[int] = None) -> dict[str, list[dict]]:
+
+def fetch_persons_data(
+    limit: Optional[int] = None,
+    download: Optional[Future] = None,
+) -> dict[str, tuple[Optional[str], list[str]]]:
     """
     Fetch persons associated with companies (board members, CEO, etc.)
     The JSON has nested structure: each entry has kaardile_kantud_isikud list.
-    Returns dict keyed by registry code with list of persons.
+    Returns dict keyed by registry code with (CEO, board member names); the
+    per-person records are reduced here so the worker sends back only names.
     """
-    zip_content = download_zip(DATASETS["persons_json"])
-    data = extract_json_from_zip(zip_content)
-    
-    print(f"    Loaded {len(data)} company records with persons")
+    zip_file = download.result() if download else download_zip(DATASETS["persons_json"])
+    data = extract_json_from_zip(zip_file)
     
     persons_by_company = {}
-    for i, record in enumerate(data):
-        if limit and i >= limit:
-            break
+    records = 0
+    for record in itertools.islice(data, limit or None):
+        records += 1
         
         reg_code = str(record.get("ariregistri_kood", "")).strip()
         if not reg_code:
@@ -158,202 +334,251 @@ def fetch_persons_data(limit: Optional[int] = None) -> dict[str, list[dict]]:
                 "name": full_name,
                 "role": p.get("isiku_roll", ""),
                 "role_text": p.get("isiku_roll_tekstina", ""),
-                "start_date": p.get("algus_kpv", ""),
-                "is_legal_person": p.get("isiku_tyyp", "") == "J",
             }
             persons.append(person)
         
         if persons:
-            persons_by_company[reg_code] = persons
+            persons_by_company[reg_code] = identify_ceo_and_board(persons)
+    
+    log(f"    Loaded {records} company records with persons")
     
     return persons_by_company
 
 
-def fetch_reports_mapping() -> dict[str, str]:
+def fetch_reports_mapping(download: Optional[Future] = None) -> tuple[dict[str, str], dict[str, tuple[str, int]]]:
     """
     Fetch mapping from report_id to registrikood.
-    Returns dict: report_id -> registrikood
+    Returns dicts: report_id -> registrikood, registrikood -> (report_id, year)
     """
-    zip_content = download_zip(DATASETS["reports_general"])
-    data = extract_csv_from_zip(zip_content)
-    
-    print(f"    Loaded {len(data)} report records")
+    zip_file = download.result() if download else download_zip(DATASETS["reports_general"])
+    data = extract_csv_from_zip(zip_file, REPORT_COLUMNS)
     
     # Build mapping: report_id -> (registrikood, year)
     # Keep most recent report per company
     company_best_report = {}  # registrikood -> (report_id, year)
     report_to_company = {}    # report_id -> registrikood
     
-    for row in data:
-        report_id = row.get("report_id", "").strip()
-        reg_code = row.get("registrikood", "").strip()
-        year = row.get("aruandeaast", "").strip()
+    rows = 0
+    for report_id, reg_code, year in data:
+        rows += 1
+        report_id = report_id.strip()
+        reg_code = reg_code.strip()
         
         if not report_id or not reg_code:
             continue
+        # Compare years as numbers; missing or malformed years rank lowest
+        year = year.strip()
+        year = int(year) if year.isdigit() else 0
         
         report_to_company[report_id] = reg_code
         
         # Track best (most recent) report per company
-        if reg_code not in company_best_report:
-            company_best_report[reg_code] = (report_id, year)
-        elif year > company_best_report[reg_code][1]:
+        best = company_best_report.get(reg_code)
+        if best is None or year > best[1]:
             company_best_report[reg_code] = (report_id, year)
     
+    log(f"    Loaded {rows} report records")
+    
     return report_to_company, company_best_report
 
 
-def fetch_financial_data(report_to_company: dict, limit: Optional[int] = None) -> dict[str, dict]:
+@functools.lru_cache(maxsize=None)
+def financial_field(label: str) -> Optional[str]:
+    """
+    Map an element label to its financial field, or None if it isn't used.
+    Labels repeat across millions of rows, so each distinct one is classified once.
+    """
+    field = FINANCIAL_LABELS.get(label)
+    if field is None and EMPLOYEES_LABEL in label and "Konsolideeritud" not in label:
+        field = "employees"
+    return field
+
+
+def fetch_financial_data(
+    report_to_company: dict,
+    limit: Optional[int] = None,
+    downloads: Optional[dict[str, Future]] = None,
+) -> dict[str, dict]:
     """
     Fetch financial data from annual report elements.
     Returns dict keyed by registry code with financial info.
     """
-    # Try 2024 first, then 2023 as fallback
+    # Try 2024 first, then 2023 as fallback. The archive is aggregated while it
+    # streams, so an error anywhere in it, not just on opening, discards that
+    # year's partial results and moves on to the next one
     for year_dataset in ["reports_elements_2024", "reports_elements_2023"]:
         try:
-            zip_content = download_zip(DATASETS[year_dataset])
-            data = extract_csv_from_zip(zip_content)
-            print(f"    Loaded {len(data)} element records")
-            break
+            download = (downloads or {}).get(year_dataset)
+            zip_file = download.result() if download else download_zip(DATASETS[year_dataset])
+            rows = extract_csv_from_zip(zip_file, ELEMENT_COLUMNS)
+            return aggregate_financials(itertools.islice(rows, limit or None), report_to_company)
         except Exception as e:
-            print(f"    Could not load {year_dataset}: {e}")
-            data = []
-    
-    if not data:
-        return {}
+            log(f"    Could not load {year_dataset}: {e}")
     
-    # Aggregate financial data by company
+    return {}
+
+
+def aggregate_financials(rows: Iterator[tuple], report_to_company: dict) -> dict[str, dict]:
+    """Aggregate (report_id, label, value) element rows into financials by company."""
     financials_by_company = defaultdict(dict)
     
-    for i, row in enumerate(data):
-        if limit and i >= limit:
-            break
+    count = 0
+    for report_id, label, value in rows:
+        count += 1
+        
+        # Most elements are irrelevant, so skip them before the report lookup
+        field = financial_field(label)
+        if field is None:
+            continue
         
-        report_id = row.get("report_id", "").strip()
-        reg_code = report_to_company.get(report_id)
+        reg_code = report_to_company.get(report_id.strip())
         
         if not reg_code:
             continue
         
-        label = row.get("elemendi_label", "")
-        value = row.get("vaartus", "").strip()
+        value = value.strip()
         
-        # Map element labels to our fields
-        if "Töötajate keskmine arv" in label and "Konsolideeritud" not in label:
+        if field == "employees":
             try:
                 financials_by_company[reg_code]["employees"] = float(value)
             except (ValueError, TypeError):
                 pass
-        elif label == "Müügitulu" or (label == "Müügitulu Konsolideeritud" and "revenue" not in financials_by_company[reg_code]):
-            financials_by_company[reg_code]["revenue"] = value
-        elif label == "Aruandeaasta kasum (kahjum)":
-            financials_by_company[reg_code]["profit"] = value
+        elif field == "consolidated_revenue":
+            financials_by_company[reg_code].setdefault("revenue", value)
+        else:
+            financials_by_company[reg_code][field] = value
+    
+    log(f"    Loaded {count} element records")
     
     return dict(financials_by_company)
 
 
-def identify_ceo(persons: list[dict]) -> Optional[str]:
+def identify_ceo_and_board(persons: list[dict]) -> tuple[Optional[str], list[str]]:
     """
-    Identify the CEO from a list of persons.
+    Identify the CEO and collect board member names from a list of persons.
     """
-    # Priority order for CEO-like roles
-    ceo_roles = ["JUHL", "JUHATUSE LIIGE", "JUHATUSE ESIMEES", "JUHATAJA", "DIREKTOR", "PROKURIST"]
+    # One pass collects the names and keeps the first named person holding the
+    # highest-priority CEO role, scanning each person's roles with a single regex
+    names = []
+    ceo, ceo_priority = None, len(CEO_ROLES)
     
-    for role_code in ceo_roles:
-        for person in persons:
-            role = f"{person.get('role', '')} {person.get('role_text', '')}".upper()
-            if role_code in role and person.get("name"):
-                return person.get("name")
-    
-    # Fallback: return first person with a name
     for person in persons:
-        if person.get("name"):
-            return person.get("name")
-    
-    return None
+        name = person.get("name")
+        if not name:
+            continue
+        names.append(name)
+        
+        if ceo_priority:
+            role = f"{person.get('role', '')} {person.get('role_text', '')}".upper()
+            for role_code in CEO_ROLE_RE.findall(role):
+                priority = CEO_ROLE_PRIORITY[role_code]
+                if priority < ceo_priority:
+                    ceo, ceo_priority = name, priority
+    
+    # Fallback: first person with a name
+    if ceo is None and names:
+        ceo = names[0]
+    return ceo, names
 
 
 def merge_all_data(
-    companies: dict[str, dict],
-    persons: dict[str, list[dict]],
+    companies: dict[str, Company],
+    persons: dict[str, tuple[Optional[str], list[str]]],
     financials: dict[str, dict],
-    company_best_report: dict[str, tuple]
-) -> dict[str, dict]:
-    """Merge all datasets into unified company records."""
+    company_best_report: dict[str, tuple[str, int]]
+) -> dict[str, Company]:
+    """Merge all datasets into unified company records.
+    
+    Expects companies as built by build_companies, with the merged fields
+    already at their empty defaults. Each dataset is joined by walking its
+    own entries and looking the company up, so companies it doesn't cover
+    are never visited.
+    """
     
-    for reg_code, company in companies.items():
-        # Add persons/CEO
-        company_persons = persons.get(reg_code, [])
-        company["board_members"] = [p.get("name") for p in company_persons if p.get("name")]
-        company["ceo"] = identify_ceo(company_persons)
-        
-        # Add financial data
-        fin = financials.get(reg_code, {})
-        if fin:
-            company["employees"] = fin.get("employees")
-            company["revenue"] = fin.get("revenue")
-            company["profit"] = fin.get("profit")
-        
-        # Add report year
-        if reg_code in company_best_report:
-            company["report_year"] = company_best_report[reg_code][1]
+    # Add persons/CEO
+    for reg_code, (ceo, board_members) in persons.items():
+        company = companies.get(reg_code)
+        if company is None:
+            continue
+        company.ceo, company.board_members = ceo, board_members
+    
+    # Add financial data
+    for reg_code, fin in financials.items():
+        company = companies.get(reg_code)
+        if company is None or not fin:
+            continue
+        company.employees = fin.get("employees")
+        company.revenue = fin.get("revenue")
+        company.profit = fin.get("profit")
+    
+    # Add report year
+    for reg_code, (_, year) in company_best_report.items():
+        company = companies.get(reg_code)
+        if company is not None:
+            company.report_year = year
     
     return companies
 
 
-def print_companies(companies: dict[str, dict], max_print: int = 100):
+def print_companies(companies: dict[str, Company], max_print: int = 100):
     """Print company data in a readable format."""
+    # Build the whole report first and write it once instead of a print() per line
+    out = []
+    line = out.append
     
-    print("\n" + "=" * 80)
-    print(f"ESTONIAN BUSINESS REGISTRY DATA - {len(companies)} companies loaded")
-    print("=" * 80 + "\n")
+    line("\n" + "=" * 80)
+    line(f"ESTONIAN BUSINESS REGISTRY DATA - {len(companies)} companies loaded")
+    line("=" * 80 + "\n")
     
     for i, (reg_code, c) in enumerate(companies.items()):
         if i >= max_print:
-            print(f"\n... and {len(companies) - max_print} more companies")
+            line(f"\n... and {len(companies) - max_print} more companies")
             break
         
-        print(f"[{i+1}] {c['name']}")
-        print(f"    Registry Code: {c['reg_code']}")
-        print(f"    Legal Form:    {c.get('legal_form', 'N/A')}")
-        print(f"    Status:        {c.get('status_text') or c.get('status', 'N/A')}")
-        print(f"    Registered:    {c.get('first_entry_date', 'N/A')}")
-        print(f"    Address:       {c.get('address', 'N/A')}")
-        if c.get('county'):
-            print(f"    County:        {c['county']}")
-        print(f"    VAT Number:    {c.get('vat_number') or 'N/A'}")
-        print(f"    CEO:           {c.get('ceo') or 'N/A'}")
+        line(f"[{i+1}] {c.name}")
+        line(f"    Registry Code: {c.reg_code}")
+        line(f"    Legal Form:    {c.legal_form}")
+        line(f"    Status:        {c.status_text or c.status}")
+        line(f"    Registered:    {c.first_entry_date}")
+        line(f"    Address:       {c.address}")
+        if c.county:
+            line(f"    County:        {c.county}")
+        line(f"    VAT Number:    {c.vat_number or 'N/A'}")
+        line(f"    CEO:           {c.ceo or 'N/A'}")
         
-        if c.get('board_members'):
-            members = c['board_members'][:5]
-            extra = f" (+{len(c['board_members'])-5} more)" if len(c['board_members']) > 5 else ""
-            print(f"    Board:         {', '.join(members)}{extra}")
+        if c.board_members:
+            members = c.board_members[:5]
+            extra = f" (+{len(c.board_members)-5} more)" if len(c.board_members) > 5 else ""
+            line(f"    Board:         {', '.join(members)}{extra}")
         
-        emp = c.get('employees')
-        year = c.get('report_year', '')
+        emp = c.employees
+        year = c.report_year
         if emp is not None:
-            print(f"    Employees:     {int(emp) if emp == int(emp) else emp}" + (f" ({year})" if year else ""))
+            line(f"    Employees:     {int(emp) if emp == int(emp) else emp}" + (f" ({year})" if year else ""))
         else:
-            print(f"    Employees:     N/A")
+            line(f"    Employees:     N/A")
         
-        if c.get('revenue'):
+        if c.revenue:
             try:
-                rev = float(c['revenue'])
-                print(f"    Revenue:       €{rev:,.2f}")
+                rev = float(c.revenue)
+                line(f"    Revenue:       €{rev:,.2f}")
             except:
-                print(f"    Revenue:       {c['revenue']}")
+                line(f"    Revenue:       {c.revenue}")
         
-        if c.get('profit'):
+        if c.profit:
             try:
-                prof = float(c['profit'])
-                print(f"    Profit:        €{prof:,.2f}")
+                prof = float(c.profit)
+                line(f"    Profit:        €{prof:,.2f}")
             except:
-                print(f"    Profit:        {c['profit']}")
+                line(f"    Profit:        {c.profit}")
         
-        if c.get('registry_link'):
-            print(f"    Link:          {c['registry_link']}")
+        if c.registry_link:
+            line(f"    Link:          {c.registry_link}")
         
-        print()
+        line("")
+    
+    out.append("")
+    sys.stdout.write("\n".join(out))
 
 
 def main():
@@ -368,21 +593,30 @@ def main():
     # Set limit to None to fetch ALL data (300k+ companies)
     LIMIT = None
     
-    print("Step 1: Fetching basic company data (lihtandmed)...")
-    companies = fetch_basic_data(limit=LIMIT)
-    print(f"  → Found {len(companies)} companies\n")
-    
-    print("Step 2: Fetching persons/management data...")
-    persons = fetch_persons_data(limit=LIMIT)
-    print(f"  → Found persons for {len(persons)} companies\n")
-    
-    print("Step 3: Fetching annual reports mapping...")
-    report_to_company, company_best_report = fetch_reports_mapping()
-    print(f"  → Mapped {len(report_to_company)} reports to {len(company_best_report)} companies\n")
-    
-    print("Step 4: Fetching financial data (employees, revenue, profit)...")
-    financials = fetch_financial_data(report_to_company, limit=LIMIT)
-    print(f"  → Found financial data for {len(financials)} companies\n")
+    # Steps 1-3 are independent and CPU-bound, so each decompresses and parses in its own
+    # process. The financial elements need the report mapping, so this process parses them
+    # as soon as step 3 is done while the workers are still busy with steps 1 and 2.
+    # Workers return plain columns and name tuples, which pickle far faster than objects.
+    with ThreadPoolExecutor(max_workers=len(PREFETCH)) as io_ex, \
+            ProcessPoolExecutor(max_workers=len(PARALLEL_STEPS)) as cpu_ex:
+        # Start the workers before any download so none inherits an open connection
+        basic = cpu_ex.submit(fetch_basic_data, LIMIT)
+        persons = cpu_ex.submit(fetch_persons_data, LIMIT)
+        reports = cpu_ex.submit(fetch_reports_mapping)
+        downloads = {name: io_ex.submit(download_zip, DATASETS[name]) for name in PREFETCH}
+        
+        log("Steps 1-3: Fetching basic company data, persons and annual reports mapping in parallel...")
+        report_to_company, company_best_report = reports.result()
+        log(f"  → Mapped {len(report_to_company)} reports to {len(company_best_report)} companies\n")
+        
+        log("Step 4: Fetching financial data (employees, revenue, profit)...")
+        financials = fetch_financial_data(report_to_company, limit=LIMIT, downloads=downloads)
+        log(f"  → Found financial data for {len(financials)} companies\n")
+        
+        companies = build_companies(basic.result())
+        log(f"  → Found {len(companies)} companies")
+        persons = persons.result()
+        log(f"  → Found persons for {len(persons)} companies\n")
     
     print("Step 5: Merging all data...")
     companies = merge_all_data(companies, persons, financials, company_best_report)
@@ -391,17 +625,26 @@ def main():
     # Print results
     print_companies(companies, max_print=100)
     
-    # Summary
+    # Summary, counted in a single pass over the companies
+    with_ceo = with_board = with_employees = with_revenue = with_profit = with_vat = 0
+    for c in companies.values():
+        with_ceo += bool(c.ceo)
+        with_board += bool(c.board_members)
+        with_employees += c.employees is not None
+        with_revenue += bool(c.revenue)
+        with_profit += bool(c.profit)
+        with_vat += bool(c.vat_number)
+    
     print("\n" + "=" * 80)
     print("SUMMARY")
     print("=" * 80)
     print(f"Total companies:           {len(companies)}")
-    print(f"With CEO identified:       {sum(1 for c in companies.values() if c.get('ceo'))}")
-    print(f"With board members:        {sum(1 for c in companies.values() if c.get('board_members'))}")
-    print(f"With employee data:        {sum(1 for c in companies.values() if c.get('employees') is not None)}")
-    print(f"With revenue data:         {sum(1 for c in companies.values() if c.get('revenue'))}")
-    print(f"With profit data:          {sum(1 for c in companies.values() if c.get('profit'))}")
-    print(f"With VAT number:           {sum(1 for c in companies.values() if c.get('vat_number'))}")
+    print(f"With CEO identified:       {with_ceo}")
+    print(f"With board members:        {with_board}")
+    print(f"With employee data:        {with_employees}")
+    print(f"With revenue data:         {with_revenue}")
+    print(f"With profit data:          {with_profit}")
+    print(f"With VAT number:           {with_vat}")
     print("=" * 80)
 
 